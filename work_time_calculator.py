@@ -20,12 +20,14 @@ Tkinter is required (install python3-tk on Linux).
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
 import platform
 import re
 import sys
 from dataclasses import dataclass
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
 
 
 def _is_wsl() -> bool:
@@ -94,17 +96,34 @@ except Exception as exc:
 
 # ----------------------------- Utilities & Parsing -----------------------------
 
+def _uniq(msgs: list[str]) -> list[str]:
+    """Drop repeated messages, keeping first-seen order."""
+    seen: set[str] = set()
+    return [m for m in msgs if not (m in seen or seen.add(m))]
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_hms(seconds: int) -> str:
+    # Totals repeat between ticks when idle, so most calls are cache hits
+    sign = "-" if seconds < 0 else ""
+    h, rem = divmod(-seconds if seconds < 0 else seconds, 3600)
+    m, sec = divmod(rem, 60)
+    return f"{sign}{h:02d}:{m:02d}:{sec:02d}"
+
+
 class TimeParser:
     """
     Parses times and durations:
       - Times: '9', '9 am', '9:15', '9:15 pm', '09:15:20', '21:07', '12 pm', '12:00 am'
       - Duration: '8:30', '08:30:00', '9', '10:15:30'
     Formats seconds as 'HH:MM:SS'.
+    Parse results are memoized; row text rarely changes between recalcs.
     """
 
     _am_pm_re = re.compile(r"\s*(am|pm)\s*$", re.IGNORECASE)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def parse_time(text: str) -> time:
         """
         Parse a clock time (same day).
@@ -150,6 +169,7 @@ class TimeParser:
         return time(hour=hh, minute=mm, second=ss)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def parse_duration(text: str) -> int:
         """
         Parse duration 'H', 'H:MM', 'H:MM:SS' into seconds.
@@ -180,12 +200,7 @@ class TimeParser:
 
     @staticmethod
     def format_hms(seconds: int) -> str:
-        sign = "-" if seconds < 0 else ""
-        s = abs(int(seconds))
-        h = s // 3600
-        m = (s % 3600) // 60
-        sec = s % 60
-        return f"{sign}{h:02d}:{m:02d}:{sec:02d}"
+        return _fmt_hms(int(seconds))
 
 
 # ----------------------------- Domain Model -----------------------------------
@@ -198,32 +213,40 @@ class TimeInterval:
     def is_open(self) -> bool:
         return self.end is None
 
-    def duration_seconds(self, on_date: date, now_dt: datetime) -> int:
-        """
-        Duration in seconds. Open interval uses now_dt.
-        Rejects cross-midnight/end-before-start.
-        """
-        start_dt = datetime.combine(on_date, self.start)
-        end_dt = now_dt if self.is_open() else datetime.combine(on_date, self.end)
-
-        if end_dt <= start_dt:
-            # end == start => 0 duration not allowed as an interval; treat as invalid
-            raise ValueError("End must be after Start within the same day (no cross-midnight).")
-
-        return int((end_dt - start_dt).total_seconds())
-
 
 class DaySchedule:
+    _END_BEFORE_START_MSG = "End must be after Start within the same day (no cross-midnight)."
+
     def __init__(self, on_date: date, target_seconds: int = 8 * 3600 + 30 * 60):
         self.on_date = on_date
         self.intervals: list[TimeInterval] = []
         self.target_seconds = target_seconds
+        self._effective: list[tuple[datetime, datetime]] = []
+        self._effective_key: tuple | None = None
 
     def set_intervals(self, intervals: list[TimeInterval]) -> None:
         self.intervals = list(intervals)
 
-    def sorted_intervals(self) -> list[TimeInterval]:
-        return sorted(self.intervals, key=lambda it: it.start)
+    def _effective_spans(self, now_dt: datetime) -> list[tuple[datetime, datetime]]:
+        """
+        (start_dt, end_dt) per interval, sorted by start. Open interval ends at now_dt.
+        Computed once per (date, interval contents, now_dt) and shared by validate/totals.
+        """
+        key = (self.on_date, tuple((it.start, it.end) for it in self.intervals), now_dt)
+        if key != self._effective_key:
+            on_date = self.on_date
+            self._effective = sorted(
+                (
+                    (
+                        datetime.combine(on_date, it.start),
+                        now_dt if it.end is None else datetime.combine(on_date, it.end),
+                    )
+                    for it in self.intervals
+                ),
+                key=lambda span: span[0],
+            )
+            self._effective_key = key
+        return self._effective
 
     def validate(self, now_dt: datetime) -> list[str]:
         msgs: list[str] = []
@@ -232,30 +255,25 @@ class DaySchedule:
         if open_count > 1:
             msgs.append("Only one open interval is allowed.")
 
-        # Build effective start/end datetimes
-        effective = []
-        for it in self.sorted_intervals():
-            start_dt = datetime.combine(self.on_date, it.start)
-            end_dt = now_dt if it.is_open() else datetime.combine(self.on_date, it.end)
+        effective = self._effective_spans(now_dt)
+        for start_dt, end_dt in effective:
             if end_dt <= start_dt:
-                msgs.append("End must be after Start within the same day (no cross-midnight).")
-            effective.append((start_dt, end_dt))
-
-        # Overlap check (touching is fine)
-        effective.sort(key=lambda t: t[0])
-        for i in range(1, len(effective)):
-            prev_end = effective[i - 1][1]
-            this_start = effective[i][0]
-            if this_start < prev_end:
-                msgs.append("Intervals overlap after sorting.")
-                break
+                msgs.append(self._END_BEFORE_START_MSG)
+
+        # Overlap check (touching is fine): each start vs. the latest end seen before it
+        running_end = itertools.accumulate((end_dt for _, end_dt in effective), max)
+        if any(start_dt < prev_end for (start_dt, _), prev_end in zip(effective[1:], running_end)):
+            msgs.append("Intervals overlap after sorting.")
 
         return msgs
 
     def total_worked_seconds(self, now_dt: datetime) -> int:
         total = 0
-        for it in self.intervals:
-            total += it.duration_seconds(self.on_date, now_dt)
+        for start_dt, end_dt in self._effective_spans(now_dt):
+            if end_dt <= start_dt:
+                # end == start => 0 duration not allowed as an interval; treat as invalid
+                raise ValueError(self._END_BEFORE_START_MSG)
+            total += int((end_dt - start_dt).total_seconds())
         return total
 
     def remaining_seconds(self, now_dt: datetime) -> int:
@@ -342,6 +360,13 @@ class GuiController:
         self.root.minsize(900, 520)
 
         self._recalc_after_id = None
+        # Inputs seen by the last recalculate; lets idle clock ticks skip it
+        self._last_sig = None
+        # (schedule, val_msgs, worked, target, now_dt) from the last recalculate
+        self._last: tuple[DaySchedule, list[str], int, int, datetime] | None = None
+        # Last values pushed to widgets without a StringVar
+        self._last_totals_text: str | None = None
+        self._last_progress_pct: int | None = None
 
         # Fonts for bold prominent labels
         default_font = tkfont.nametofont("TkDefaultFont")
@@ -434,7 +459,7 @@ class GuiController:
         )
         self.lbl_totals.pack(side="top", anchor="w")
 
-        self.progress = ttk.Progressbar(self.frm_totals, orient="horizontal", mode="determinate", length=360)
+        self.progress = ttk.Progressbar(self.frm_totals, orient="horizontal", mode="determinate", length=360, maximum=100)
         self.progress.pack(side="left", padx=(0, 10), pady=(6, 0))
         self.var_progress = tk.StringVar(value="0%")
         ttk.Label(self.frm_totals, textvariable=self.var_progress).pack(side="left", pady=(6, 0))
@@ -473,6 +498,12 @@ class GuiController:
         # Initial calculation
         self.recalculate()
 
+    @staticmethod
+    def _set(var: tk.Variable, value) -> None:
+        # get() is still a Tcl call; this only skips the trace/redraw of an unchanged set()
+        if var.get() != value:
+            var.set(value)
+
     def _on_canvas_resize(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
@@ -514,11 +545,22 @@ class GuiController:
 
     def _tick_clock(self):
         now_dt = datetime.now().replace(microsecond=0)
-        self.var_now.set(now_dt.strftime("%H:%M:%S"))
-        # Optional: keep milestones current without manual recalc
-        self._schedule_recalc()
+        self._set(self.var_now, now_dt.strftime("%H:%M:%S"))
+        # Keep milestones current without manual recalc. A full recalc is only
+        # needed if inputs changed or an open interval is still accruing time.
+        sig = self._input_signature()
+        if sig != self._last_sig or sig[2]:
+            self._schedule_recalc()
+        elif self._last is not None:
+            _, _, worked, target, _ = self._last
+            self._set_milestone_message(worked=worked, target=target, now_dt=now_dt)
         self.root.after(1000, self._tick_clock)
 
+    def _input_signature(self) -> tuple:
+        texts = tuple((r.var_start.get(), r.var_end.get()) for r in self.rows)
+        any_open = any(st.strip() and not en.strip() for st, en in texts)
+        return texts, self.var_target.get(), any_open
+
     def _schedule_recalc(self):
         # Debounce recalculation during typing/clock ticks
         if self._recalc_after_id is not None:
@@ -560,8 +602,8 @@ class GuiController:
         self.recalculate()
 
     def sort_by_start(self):
-        def keyf(r: IntervalRow):
-            txt = r.var_start.get().strip()
+        def keyf(txt: str) -> time:
+            txt = txt.strip()
             if not txt:
                 return time(23, 59, 59)
             try:
@@ -569,26 +611,16 @@ class GuiController:
             except Exception:
                 return time(23, 59, 59)
 
-        # Capture values
+        # Capture values, sort, and write them back into the existing rows
+        # (rows are identical, so there is no need to rebuild widgets)
         snapshot = [(r.var_start.get(), r.var_end.get(), r.var_select.get()) for r in self.rows]
-        snapshot.sort(key=lambda t: keyf(self._fake_row_for_sort(t[0])))
-        # Rebuild rows cleanly (simpler than moving widgets)
-        for r in self.rows:
-            r.destroy()
-        self.rows = []
-        for s, e, sel in snapshot:
-            r = self.add_row()
+        snapshot.sort(key=lambda t: keyf(t[0]))
+        for r, (s, e, sel) in zip(self.rows, snapshot):
             r.var_start.set(s)
             r.var_end.set(e)
             r.var_select.set(sel)
         self.recalculate()
 
-    def _fake_row_for_sort(self, start_text: str) -> IntervalRow:
-        # Lightweight helper to reuse keyf; not attached to UI
-        class _Fake:
-            def __init__(self, t): self.var_start = type("V", (), {"get": lambda self2: t})()
-        return _Fake(start_text)  # type: ignore
-
     def _collect_schedule(self) -> tuple[DaySchedule, list[str]]:
         now_dt = datetime.now().replace(microsecond=0)
         schedule = DaySchedule(on_date=date.today())
@@ -640,19 +672,19 @@ class GuiController:
         Policy: If you are checking the app, you are working now, so absolute times are NOW + delta.
         """
         if target <= 0:
-            self.var_milestone_1.set("Target is 00:00:00 (or invalid).")
-            self.var_milestone_2.set("")
+            self._set(self.var_milestone_1, "Target is 00:00:00 (or invalid).")
+            self._set(self.var_milestone_2, "")
             return
 
         if worked < target:
             remaining = target - worked
-            hit_time = (now_dt + (now_dt - now_dt) + (now_dt - now_dt))  # placeholder removed below
-
-            hit_time = now_dt + _seconds_to_timedelta(remaining)
-            self.var_milestone_1.set(
+            hit_time = now_dt + timedelta(seconds=remaining)
+            self._set(
+                self.var_milestone_1,
                 f"{TimeParser.format_hms(remaining)} left to reach target {TimeParser.format_hms(target)}."
             )
-            self.var_milestone_2.set(
+            self._set(
+                self.var_milestone_2,
                 f"If you keep working, you’ll reach the target at: {hit_time.strftime('%H:%M:%S')}"
             )
             return
@@ -663,26 +695,31 @@ class GuiController:
         overtime_hms = TimeParser.format_hms(overtime)
 
         if to_next == 0:
-            self.var_milestone_1.set(
+            self._set(
+                self.var_milestone_1,
                 f"Overtime: {overtime_hms}. You are already at a whole extra hour."
             )
             # Next whole hour after current whole hour is +1h (optional but useful)
-            next_time = now_dt + _seconds_to_timedelta(3600)
-            self.var_milestone_2.set(
+            next_time = now_dt + timedelta(seconds=3600)
+            self._set(
+                self.var_milestone_2,
                 f"Next overtime whole-hour milestone (+01:00:00) at: {next_time.strftime('%H:%M:%S')}"
             )
         else:
             next_whole_overtime = overtime + to_next
-            when = now_dt + _seconds_to_timedelta(to_next)
-            self.var_milestone_1.set(
+            when = now_dt + timedelta(seconds=to_next)
+            self._set(
+                self.var_milestone_1,
                 f"Overtime: {overtime_hms}. {TimeParser.format_hms(to_next)} more to reach extra {TimeParser.format_hms(next_whole_overtime)}."
             )
-            self.var_milestone_2.set(
+            self._set(
+                self.var_milestone_2,
                 f"If you keep working, you’ll reach that at: {when.strftime('%H:%M:%S')}"
             )
 
     def recalculate(self):
         now_dt = datetime.now().replace(microsecond=0)
+        self._last_sig = self._input_signature()
         schedule, val_msgs = self._collect_schedule()
 
         # Parse target
@@ -693,7 +730,7 @@ class GuiController:
             schedule.target_seconds = 8 * 3600 + 30 * 60
 
         if val_msgs:
-            self.var_status.set(" ; ".join(dict.fromkeys(val_msgs)))
+            self.var_status.set(" ; ".join(_uniq(val_msgs)))
         else:
             self.var_status.set("OK.")
 
@@ -709,43 +746,44 @@ class GuiController:
         target = schedule.target_seconds
         remaining = max(0, target - worked)
         overtime = max(0, worked - target)
+        self._last = (schedule, val_msgs, worked, target, now_dt)
 
-        self.var_worked.set(TimeParser.format_hms(worked))
-        self.var_remaining.set(TimeParser.format_hms(remaining))
-        self.var_overtime.set(TimeParser.format_hms(overtime))
-
-        self.lbl_totals.config(
-            text=f"Worked: {self.var_worked.get()}    "
-                 f"Remaining: {self.var_remaining.get()}    "
-                 f"Overtime: {self.var_overtime.get()}"
+        worked_hms = TimeParser.format_hms(worked)
+        remaining_hms = TimeParser.format_hms(remaining)
+        overtime_hms = TimeParser.format_hms(overtime)
+        self._set(self.var_worked, worked_hms)
+        self._set(self.var_remaining, remaining_hms)
+        self._set(self.var_overtime, overtime_hms)
+
+        totals_text = (
+            f"Worked: {worked_hms}    "
+            f"Remaining: {remaining_hms}    "
+            f"Overtime: {overtime_hms}"
         )
+        if totals_text != self._last_totals_text:
+            self.lbl_totals.config(text=totals_text)
+            self._last_totals_text = totals_text
 
         # Progress
         ratio = min(1.0, worked / target) if target > 0 else 1.0
-        self.progress["maximum"] = 100
-        self.progress["value"] = int(ratio * 100)
-        self.var_progress.set(f"{int(ratio * 100)}%")
+        pct = int(ratio * 100)
+        if pct != self._last_progress_pct:
+            self.progress["value"] = pct
+            self._last_progress_pct = pct
+        self._set(self.var_progress, f"{pct}%")
 
         # Milestone (always shown; assumes you're working when checking)
         self._set_milestone_message(worked=worked, target=target, now_dt=now_dt)
 
     def copy_summary(self):
+        # Reuse the last recalculation unless inputs changed since, or an open
+        # interval means the totals have moved on
+        sig = self._input_signature()
+        if self._last is None or sig != self._last_sig or sig[2]:
+            self.recalculate()
+        schedule, val_msgs, worked, target, _ = self._last
         now_dt = datetime.now().replace(microsecond=0)
-        schedule, val_msgs = self._collect_schedule()
-
-        try:
-            schedule.target_seconds = TimeParser.parse_duration(self.var_target.get())
-        except Exception:
-            schedule.target_seconds = 8 * 3600 + 30 * 60
-
-        worked = 0
-        if not val_msgs:
-            try:
-                worked = schedule.total_worked_seconds(now_dt)
-            except Exception:
-                worked = 0
 
-        target = schedule.target_seconds
         remaining = max(0, target - worked)
         overtime = max(0, worked - target)
 
@@ -760,7 +798,7 @@ class GuiController:
             if s or (e and e != "(open)"):
                 lines.append(f"  - {s} → {e}")
         if val_msgs:
-            lines.append("Validation: " + " ; ".join(dict.fromkeys(val_msgs)))
+            lines.append("Validation: " + " ; ".join(_uniq(val_msgs)))
         lines.append(f"Worked: {TimeParser.format_hms(worked)}")
         lines.append(f"Remaining: {TimeParser.format_hms(remaining)}")
         lines.append(f"Overtime: {TimeParser.format_hms(overtime)}")
@@ -778,11 +816,6 @@ class GuiController:
         self.var_status.set("Summary copied to clipboard.")
 
 
-def _seconds_to_timedelta(seconds: int):
-    # tiny helper (kept separate to avoid importing timedelta explicitly)
-    return datetime.fromtimestamp(0) - datetime.fromtimestamp(0) + (datetime.fromtimestamp(seconds) - datetime.fromtimestamp(0))
-
-
 def main():
     try:
         root = tk.Tk()